@@ -7,54 +7,420 @@ Uses Fortinet-inspired colors: secure red, cloud blue, sase purple, connectivity
 
 import cv2
 import numpy as np
+import numba
+from numba import njit, prange
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
-import math
+import io
 import os
+import shutil
+import subprocess
+import queue
+import threading
+from collections import deque
+from functools import lru_cache
+import multiprocessing
+import atexit
+
+# Async requests render on several threads at once, so the parallel kernels need a
+# thread-safe layer (OpenMP or TBB); without one warm_up fails loudly at startup
+# instead of the workqueue layer aborting the server on concurrent use
+numba.config.THREADING_LAYER = "threadsafe"
+
+# First frame row the lowerthird can draw on; the overlay layer only spans the rows below
+OVERLAY_TOP = 800
+
+# Font search paths, tried in order
+TITLE_FONT_PATHS = ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",)
+SUBTITLE_FONT_PATHS = ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",)
+LOGO_FONT_PATHS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc"
+)
+
+@lru_cache(maxsize=None)
+def font_data(font_path):
+    """Contents of a font file, read from disk once however many sizes are loaded from it"""
+    with open(font_path, "rb") as f:
+        return f.read()
+
+@lru_cache(maxsize=32)
+def load_font(font_paths, size):
+    """
+    Load the first available TrueType font, falling back to PIL's default font
+    Cached per (paths, size), so every renderer in the process shares one face per size
+    """
+    for font_path in font_paths:
+        try:
+            return ImageFont.truetype(io.BytesIO(font_data(font_path)), size)
+        except:
+            continue
+    return ImageFont.load_default()
+
+# Pixel kernels - integer blends matching Pillow's paste, text fill and alpha_composite,
+# JIT-compiled so each layer is blended in a single pass without intermediate Images
+
+@njit(cache=True, parallel=True)
+def _paste_rgba(dst, src, x, y):
+    """Paste an RGBA tile onto an RGBA layer at (x, y), masked by its own alpha (Image.paste)"""
+    y0, y1 = max(y, 0), min(y + src.shape[0], dst.shape[0])
+    x0, x1 = max(x, 0), min(x + src.shape[1], dst.shape[1])
+    for yy in prange(y0, y1):
+        tile = src[yy - y, x0 - x:x1 - x]
+        row = dst[yy, x0:x1]
+        for i in range(tile.shape[0]):
+            a = np.int32(tile[i, 3])
+            if a == 0:
+                continue
+            for c in range(4):
+                v = row[i, c] * (255 - a) + tile[i, c] * a + 128
+                row[i, c] = ((v >> 8) + v) >> 8
+
+@njit(cache=True, parallel=True)
+def _fill_mask(dst, mask, ink, x, y):
+    """Fill an RGBA layer with an RGBA ink through a coverage mask at (x, y) (ImageDraw.text)"""
+    y0, y1 = max(y, 0), min(y + mask.shape[0], dst.shape[0])
+    x0, x1 = max(x, 0), min(x + mask.shape[1], dst.shape[1])
+    for yy in prange(y0, y1):
+        coverage = mask[yy - y, x0 - x:x1 - x]
+        row = dst[yy, x0:x1]
+        for i in range(coverage.shape[0]):
+            m = np.int32(coverage[i])
+            if m == 0:
+                continue
+            # Colour lands at full strength on fully transparent pixels
+            cm = 255 if row[i, 3] == 0 else m
+            for c in range(4):
+                k = cm if c < 3 else m
+                v = row[i, c] * (255 - k) + ink[c] * k + 128
+                row[i, c] = ((v >> 8) + v) >> 8
+
+@njit(cache=True, parallel=True)
+def _composite_over(canvas, layer, x, y):
+    """Composite an RGBA layer over an opaque BGR canvas at (x, y) (Image.alpha_composite)"""
+    y0, y1 = max(y, 0), min(y + layer.shape[0], canvas.shape[0])
+    x0, x1 = max(x, 0), min(x + layer.shape[1], canvas.shape[1])
+    for yy in prange(y0, y1):
+        # Per-row views hoist the offset math out of the pixel loop
+        src = layer[yy - y, x0 - x:x1 - x]
+        dst = canvas[yy, x0:x1]
+        for i in range(src.shape[0]):
+            a = np.int32(src[i, 3])
+            if a == 0:
+                continue
+            for c in range(3):
+                v = (src[i, 2 - c] * a + dst[i, c] * (255 - a) + 128) << 7
+                dst[i, c] = ((((v >> 8) + v) >> 8) >> 7)
+
+@njit(cache=True)
+def _fill_spans(dst, spans, top, ink):
+    """Set row top + i of an RGBA layer to ink over the column span spans[i], clipped vertically"""
+    for i in range(spans.shape[0]):
+        row = top + i
+        if row < 0 or row >= dst.shape[0]:
+            continue
+        for xx in range(spans[i, 0], spans[i, 1]):
+            for c in range(4):
+                dst[row, xx, c] = ink[c]
+
+@lru_cache(maxsize=None)
+def _rounded_corners(height, radius):
+    """Rounded-rectangle stencil just wide enough to hold both corner columns"""
+    edge = radius + 2
+    stencil = Image.new('L', (2 * edge + 1, height), 0)
+    ImageDraw.Draw(stencil).rounded_rectangle([0, 0, 2 * edge, height - 1], radius=radius, fill=255)
+    return np.asarray(stencil), edge
+
+@lru_cache(maxsize=256)
+def _narrow_rounded_mask(width, height, radius):
+    """Rounded-rectangle mask rasterized by ImageDraw, for widths the stencil cannot stitch"""
+    mask = Image.new('L', (width, height), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, width - 1, height - 1], radius=radius, fill=255)
+    return np.asarray(mask)
+
+def rounded_mask(width, height, radius, out=None):
+    """
+    Rounded-rectangle mask (0/255) of any width, stitched from a cached corner stencil
+    Identical to ImageDraw.rounded_rectangle over the whole width x height box
+    Written into out (a height x width uint8 array or view) when given
+    """
+    corners, edge = _rounded_corners(height, radius)
+    if width <= 2 * edge:
+        # Too narrow for the corners to be separated - use the directly rasterized mask
+        mask = _narrow_rounded_mask(width, height, radius)
+        if out is None:
+            return mask.copy()
+        out[:] = mask
+        return out
+    mask = np.empty((height, width), np.uint8) if out is None else out
+    mask[:, :edge] = corners[:, :edge]
+    mask[:, edge:width - edge] = corners[:, edge:edge + 1]
+    mask[:, width - edge:] = corners[:, edge + 1:]
+    return mask
+
+@lru_cache(maxsize=None)
+def line_spans(width):
+    """
+    Covered column range (start, end) of each row of the background line ellipse
+    [0, 0, width, 40], clipped to width columns - ellipse rows are single spans
+    Returned as a read-only (41, 2) array for _fill_spans
+    """
+    mask = Image.new('L', (width + 1, 41), 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, width, 40], fill=255)
+    spans = np.zeros((41, 2), np.int64)
+    for i, row in enumerate(np.asarray(mask)[:, :width] > 0):
+        covered = np.flatnonzero(row)
+        if len(covered):
+            spans[i] = covered[0], covered[-1] + 1
+    spans.flags.writeable = False
+    return spans
+
+def scale_alpha(tile, alpha, out=None):
+    """
+    Return a copy of an RGBA array with its alpha channel scaled by alpha (0-255)
+    Written into out (an array or view of the tile's shape) when given
+    """
+    scaled = tile.copy() if out is None else out
+    if out is not None:
+        scaled[..., :3] = tile[..., :3]
+    scaled[..., 3] = tile[..., 3].astype(np.uint16) * alpha // 255
+    return scaled
+
+@lru_cache(maxsize=64)
+def gradient_line(steps, color1, color2):
+    """
+    (steps, 3) uint8 colour ramp from color1 towards color2, shared by all gradients
+    of the same length and colours - callers must not modify it
+    """
+    c1 = np.array(color1, np.int32)
+    c2 = np.array(color2, np.int32)
+    # Same truncating interpolation as a per-line loop; floor division keeps it
+    # in integers (int32 - the products exceed int16)
+    pos = np.arange(steps, dtype=np.int32)[:, None]
+    line = (c1 + (c2 - c1) * pos // steps).astype(np.uint8)
+    line.flags.writeable = False
+    return line
+
+@lru_cache(maxsize=1024)
+def text_bbox(text, font):
+    """Bounding box of text in a font (font.getbbox), memoized - metrics never change"""
+    return font.getbbox(text)
+
+@lru_cache(maxsize=1024)
+def text_mask(text, font):
+    """
+    Rasterize text to a read-only coverage mask, returning (mask, left, top) relative to
+    the text origin - memoized, so renderers sharing a font share its glyph renders
+    """
+    left, top, right, bottom = text_bbox(text, font)
+    mask = Image.new('L', (max(right - left, 0), max(bottom - top, 0)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return np.asarray(mask), left, top
+
+# Full-opacity logo renders keyed by (palette, size), shared by every renderer of a style
+_logo_renders = {}
+
+# Animation schedules keyed by (total_frames, height) - the easing curves only depend
+# on the clip length, so every renderer of that length reads the same tables. Clip
+# lengths come from requests, so only the most recently built few are kept
+_schedules = {}
+_schedules_lock = threading.Lock()
+MAX_SCHEDULES = 8
+
+# Frame-state lists kept per renderer. A pooled worker's renderer serves every
+# concurrent request of its style, so it keeps a list for each recent video
+MAX_FRAME_STATES = 8
+
+# Blurred glow tiles keyed by (palette, kind, alphas) - blurring is the costliest step
+# of a glow, so each distinct glow is blurred once per process
+_glow_renders = {}
+
+def ink_box(boxes, shape):
+    """
+    Union of (x, y, width, height) placements clipped to an array shape,
+    as a (y0, y1, x0, x1) slice box - None when nothing lands inside
+    """
+    x0 = max(min((x for x, y, w, h in boxes), default=0), 0)
+    y0 = max(min((y for x, y, w, h in boxes), default=0), 0)
+    x1 = min(max((x + w for x, y, w, h in boxes), default=0), shape[1])
+    y1 = min(max((y + h for x, y, w, h in boxes), default=0), shape[0])
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return y0, y1, x0, x1
 
 class DataDashRenderer:
+    # DataDash color schemes using Fortinet-inspired palette
+    colors = {
+        "cloud_blue": {
+            "primary": (48, 127, 226),      # Cloud Blue #307FE2
+            "secondary": (30, 90, 180),     # Deeper cloud blue
+            "accent": (200, 220, 255),      # Light blue accent
+            "white": (255, 255, 255),
+            "dark": (20, 40, 80),           # Dark blue for depth
+            "background": (0, 0, 0)         # Black for solid background
+        },
+        "secure_red": {
+            "primary": (218, 41, 28),       # Secure Red #DA291C
+            "secondary": (160, 30, 20),     # Deeper secure red
+            "accent": (255, 180, 170),      # Light red accent
+            "white": (255, 255, 255),
+            "dark": (80, 15, 10),           # Dark red
+            "background": (0, 0, 0)         # Black background
+        },
+        "sase_purple": {
+            "primary": (144, 99, 205),      # SASE Purple #9063CD
+            "secondary": (100, 70, 150),    # Deeper purple
+            "accent": (200, 180, 230),      # Light purple accent
+            "white": (255, 255, 255),
+            "dark": (40, 30, 80),           # Dark purple
+            "background": (0, 0, 0)         # Black background
+        },
+        "connectivity_yellow": {
+            "primary": (255, 185, 0),       # Connectivity Yellow #FFB900
+            "secondary": (200, 145, 0),     # Deeper yellow
+            "accent": (255, 230, 150),      # Light yellow accent
+            "white": (255, 255, 255),
+            "dark": (80, 60, 0),            # Dark yellow/brown
+            "background": (0, 0, 0)         # Black background
+        }
+    }
+    
     def __init__(self, style="default"):
         self.width = 1920
         self.height = 1080
         self.fps = 30  # Optimized for smooth rendering
         self.style = style
         
-        # DataDash color schemes using Fortinet-inspired palette
-        self.colors = {
-            "cloud_blue": {
-                "primary": (48, 127, 226),      # Cloud Blue #307FE2
-                "secondary": (30, 90, 180),     # Deeper cloud blue
-                "accent": (200, 220, 255),      # Light blue accent
-                "white": (255, 255, 255),
-                "dark": (20, 40, 80),           # Dark blue for depth
-                "background": (0, 0, 0)         # Black for solid background
-            },
-            "secure_red": {
-                "primary": (218, 41, 28),       # Secure Red #DA291C
-                "secondary": (160, 30, 20),     # Deeper secure red
-                "accent": (255, 180, 170),      # Light red accent
-                "white": (255, 255, 255),
-                "dark": (80, 15, 10),           # Dark red
-                "background": (0, 0, 0)         # Black background
-            },
-            "sase_purple": {
-                "primary": (144, 99, 205),      # SASE Purple #9063CD
-                "secondary": (100, 70, 150),    # Deeper purple
-                "accent": (200, 180, 230),      # Light purple accent
-                "white": (255, 255, 255),
-                "dark": (40, 30, 80),           # Dark purple
-                "background": (0, 0, 0)         # Black background
-            },
-            "connectivity_yellow": {
-                "primary": (255, 185, 0),       # Connectivity Yellow #FFB900
-                "secondary": (200, 145, 0),     # Deeper yellow
-                "accent": (255, 230, 150),      # Light yellow accent
-                "white": (255, 255, 255),
-                "dark": (80, 60, 0),            # Dark yellow/brown
-                "background": (0, 0, 0)         # Black background
-            }
-        }
-        
+        # Colours stay plain tuples: inks are passed to the kernels as fixed-size tuples,
+        # which Numba receives by value without boxing an array per call
         self.current_colors = self.colors.get(style, self.colors["cloud_blue"])
+        self._palette_key = tuple(self.current_colors.items())
+        
+        # Fonts never change during a render - load them once instead of per frame
+        self.title_font = load_font(TITLE_FONT_PATHS, 52)
+        self.subtitle_font = load_font(SUBTITLE_FONT_PATHS, 36)
+        self.logo_fonts = {}
+        self.logo_font = self.get_logo_font(int(75 * 0.6))
+        
+        # Frames only rescale the alpha of the shared full-opacity logo renders
+        self._base_logo = self._get_base_logo(75)
+        
+        # Blurred glow tiles: the logo halo is blurred once at full opacity and
+        # rescaled per frame, ambient glows are kept per distinct layer alphas.
+        # Rescaling the blurred halo approximates blurring a low-alpha ellipse: the
+        # halo-phase frames differ from a per-frame blur by up to 4 levels
+        self._logo_glow = self._get_glow("logo", 255, self.create_logo_glow)
+        
+        # Scratch tiles the alpha-scaled logo and halo are written into each frame
+        self._logo_scratch = np.empty_like(self._base_logo)
+        self._logo_glow_scratch = np.empty_like(self._logo_glow)
+        self._edge_glow_cache = {}
+        
+        # Output frame buffer in OpenCV's BGR layout, reused by every create_frame call
+        self._bgr_buf = np.empty((self.height, self.width, 3), np.uint8)
+        
+        # Solid style background baked once in BGR; frames start from a plain copy of it
+        # instead of broadcasting the fill colour across the buffer every time
+        self._base_frame = np.empty_like(self._bgr_buf)
+        self._base_frame[:] = self.current_colors["background"][::-1]
+        # Regions of the output buffer drawn over since it last matched the template
+        self._canvas_dirty = None
+        
+        # Background and overlay layers, cleared in place each frame instead of reallocated
+        self._bg_layer = np.zeros((self.height, self.width, 4), np.uint8)
+        self._overlay = np.zeros((self.height - OVERLAY_TOP, self.width, 4), np.uint8)
+        # Regions of each layer that may still hold the previous frame's ink
+        self._bg_dirty = []
+        self._overlay_box = None
+        
+        # Full-width bar tiles: black shadow, white glass and accent highlight. Each
+        # frame slices its bar width and only rewrites the alpha channel
+        max_bar_width, max_bar_height = 650, 200
+        self._bar_shadow = np.zeros((max_bar_height + 1, max_bar_width + 1, 4), np.uint8)
+        self._bar_glass = np.full((max_bar_height, max_bar_width, 4), 255, np.uint8)
+        self._bar_accent = np.empty((3, max_bar_width, 4), np.uint8)
+        self._bar_accent[..., :3] = self.current_colors["accent"]
+        # Last composed bar, as ((width, height), tile)
+        self._bar_tile = None
+        
+        # Drawing state (and inputs) of the frame currently held in the output buffer
+        self._prev_state = None
+        
+        # Per-frame animation schedule, built once per video length
+        self._sched = None
+        self._sched_frames = None
+        
+        # Per-frame drawing states of recently rendered videos, least recently used first
+        self._states = {}
+        
+    def get_logo_font(self, font_size):
+        """Return the logo font at the given size, loading it on first use"""
+        font = self.logo_fonts.get(font_size)
+        if font is None:
+            font = self.logo_fonts[font_size] = load_font(LOGO_FONT_PATHS, font_size)
+        return font
+    
+    def _get_base_logo(self, size):
+        """Return the read-only full-opacity logo for a size as an RGBA array, rendering it on first use"""
+        key = (self._palette_key, size)
+        logo = _logo_renders.get(key)
+        if logo is None:
+            logo = self.create_professional_logo(size, self.current_colors, 1.0, as_array=True)
+            logo.flags.writeable = False
+            _logo_renders[key] = logo
+        return logo
+    
+    def get_logo(self, size, alpha):
+        """
+        Return the cached logo for a size as an RGBA array with its alpha scaled by alpha (0-255)
+        The result lives in a scratch buffer that the next call overwrites
+        """
+        logo = self._get_base_logo(size)
+        scratch = self._logo_scratch[:logo.shape[0], :logo.shape[1]]
+        return scale_alpha(logo, alpha, out=scratch)
+    
+    def create_logo_glow(self, alpha):
+        """Create the blurred halo shown before the logo materializes"""
+        logo_size = 75
+        glow_size = int(logo_size * 1.2)
+        
+        glow_img = Image.new('RGBA', (glow_size * 2, glow_size), (0, 0, 0, 0))
+        glow_draw = ImageDraw.Draw(glow_img)
+        glow_draw.ellipse([glow_size//4, glow_size//4, glow_size*1.75, glow_size*0.75], 
+                        fill=(*self.current_colors["primary"], alpha))
+        return glow_img.filter(ImageFilter.GaussianBlur(radius=15))
+    
+    def create_ambient_glow(self, layer_alphas):
+        """Create the blurred ambient glow from the alphas of its concentric layers"""
+        # Create sophisticated glow area
+        glow_width, glow_height = 700, 140
+        glow_img = Image.new('RGBA', (glow_width, glow_height), (0, 0, 0, 0))
+        glow_draw = ImageDraw.Draw(glow_img)
+        
+        # Multi-layer glow for premium depth
+        center_x, center_y = glow_width // 2, glow_height // 2
+        for radius, alpha in zip([60, 40, 20], layer_alphas):
+            glow_draw.ellipse([center_x - radius, center_y - radius, 
+                             center_x + radius, center_y + radius],
+                            fill=(*self.current_colors["primary"], alpha))
+        
+        # Apply sophisticated blur
+        return glow_img.filter(ImageFilter.GaussianBlur(radius=25))
+    
+    def get_ambient_glow(self, layer_alphas):
+        """Return the ambient glow for the given layer alphas as an RGBA array, blurring it on first use"""
+        return self._get_glow("ambient", layer_alphas, self.create_ambient_glow)
+    
+    def _get_glow(self, kind, alphas, create):
+        """Return a shared read-only glow tile as an RGBA array, blurring it with create(alphas) on first use"""
+        key = (self._palette_key, kind, alphas)
+        glow = _glow_renders.get(key)
+        if glow is None:
+            glow = np.array(create(alphas))
+            glow.flags.writeable = False
+            _glow_renders[key] = glow
+        return glow
         
     def ease_out_quart(self, t):
         """Smooth quartic ease-out for natural animation"""
@@ -62,76 +428,132 @@ class DataDashRenderer:
     
     def ease_in_out_sine(self, t):
         """Sine wave easing for most natural motion"""
-        return -(math.cos(math.pi * t) - 1) / 2
+        return -(np.cos(np.pi * t) - 1) / 2
     
-    def create_gradient(self, width, height, color1, color2, direction='horizontal'):
-        """Create a gradient background"""
-        gradient = Image.new('RGB', (width, height), color1)
-        draw = ImageDraw.Draw(gradient)
+    def build_schedule(self, total_frames):
+        """
+        Precompute every per-frame animation value for a video of total_frames frames
+        Each entry is a read-only array of shape (total_frames,) indexed by frame number,
+        shared by all renderers of the same length
+        """
+        key = (total_frames, self.height)
+        with _schedules_lock:
+            sched = _schedules.get(key)
+        if sched is not None:
+            self._sched, self._sched_frames = sched, total_frames
+            return sched
+        
+        t = np.arange(total_frames) / total_frames
         
+        # Bar grows between 20% and 70% of the clip
+        bar_start, bar_duration = 0.2, 0.5
+        bar_active = (t > bar_start) & (t <= bar_start + bar_duration)
+        bar_progress = self.ease_out_quart((t - bar_start) / bar_duration)
+        
+        # Logo: glow (phase 1), scaled materialization (phase 2), settle (phase 3)
+        logo_start, logo_duration = 0.4, 0.4
+        logo_t = np.minimum((t - logo_start) / logo_duration, 1.0)
+        logo_phase = np.select([t <= logo_start, logo_t < 0.3, logo_t < 0.7], [0, 1, 2], 3)
+        logo_glow = self.ease_in_out_sine(logo_t / 0.3) * 0.3
+        logo_scale = self.ease_out_quart((logo_t - 0.3) / 0.4)
+        logo_settle = 0.8 + 0.2 * self.ease_out_quart((logo_t - 0.7) / 0.3)
+        logo_alpha = np.where(logo_phase == 3, logo_settle, logo_scale)
+        
+        # Character-by-character title and word-by-word subtitle reveals
+        title_start, title_duration = 0.6, 0.5
+        title_t = np.minimum((t - title_start) / title_duration, 1.0)
+        subtitle_start, subtitle_duration = 0.8, 0.4
+        subtitle_t = np.minimum((t - subtitle_start) / subtitle_duration, 1.0)
+        
+        # Ambient glow builds from the middle of the clip
+        glow_start = 0.5
+        glow_alpha = np.minimum((t - glow_start) / 0.4, 0.2)
+        
+        # Background: three drifting lines from 10% on, left edge glow until 80%
+        line_index = np.arange(3)
+        line_wave = np.sin((t[:, None] * 2 + line_index) * np.pi)
+        line_y = self.height - 200 + (100 * line_wave).astype(int) + line_index * 40
+        line_alpha = (30 * np.minimum((t - 0.1) / 0.3, 0.05)).astype(int)  # Max 5% opacity
+        
+        # Integer drawing values (pixel sizes and 0-255 alphas) derived from the curves
+        # above in one pass, so frame states are read without per-frame float math.
+        # The float curves themselves are not kept in the schedule
+        title_alpha = np.minimum(title_t * 1.2, 1.0)  # Slightly faster alpha ramp
+        subtitle_alpha = np.minimum(subtitle_t * 1.3, 1.0)
+        glow_radii = np.array([60, 40, 20])
+        
+        self._sched = {
+            "lines_active": t > 0.1,
+            "line_alpha": line_alpha,
+            "line_y": line_y,
+            "edge_glow_active": t < 0.8,
+            "edge_glow": (20 * (t / 0.8)).astype(int),
+            "bar_active": bar_active,
+            "logo_phase": logo_phase,
+            "title_active": t > title_start,
+            "title_reveal": self.ease_out_quart(title_t),
+            "subtitle_active": t > subtitle_start,
+            "subtitle_reveal": self.ease_out_quart(subtitle_t),
+            "glow_active": t > glow_start,
+            "bar_width": (650 * bar_progress).astype(int),
+            "bar_accent": (180 * bar_progress).astype(int),
+            "logo_glow_alpha": (60 * logo_glow).astype(int),
+            "logo_size": (75 * (0.8 + 0.2 * logo_scale)).astype(int),  # Slight scale animation
+            "logo_alpha8": (255 * logo_alpha).astype(int),
+            "title_shadow": ((80 - np.arange(2) * 20) * title_t[:, None]).astype(int),
+            "title_alpha8": (255 * title_alpha).astype(int),
+            "title_glow": (60 * title_t).astype(int),
+            "subtitle_shadow": (100 * subtitle_t).astype(int),
+            "subtitle_alpha8": (240 * subtitle_alpha).astype(int),
+            "glow_layers": (20 * glow_alpha[:, None] * (60 - glow_radii) / 40).astype(int),
+        }
+        for values in self._sched.values():
+            values.flags.writeable = False
+        with _schedules_lock:
+            # Evict the oldest schedules (dicts keep insertion order)
+            while len(_schedules) >= MAX_SCHEDULES:
+                del _schedules[next(iter(_schedules))]
+            _schedules[key] = self._sched
+        self._sched_frames = total_frames
+        return self._sched
+    
+    def get_schedule(self, total_frames):
+        """Return the animation schedule for total_frames, building it if needed"""
+        if self._sched is None or self._sched_frames != total_frames:
+            self.build_schedule(total_frames)
+        return self._sched
+    
+    def gradient_array(self, width, height, color1, color2, direction='horizontal'):
+        """
+        Gradient as a read-only (height, width, 3) uint8 view of a single line
+        Consumers use it directly, without materializing the full image
+        """
         if direction == 'horizontal':
-            for x in range(width):
-                r = int(color1[0] + (color2[0] - color1[0]) * x / width)
-                g = int(color1[1] + (color2[1] - color1[1]) * x / width)
-                b = int(color1[2] + (color2[2] - color1[2]) * x / width)
-                draw.line([(x, 0), (x, height)], fill=(r, g, b))
+            line = gradient_line(width, color1, color2)[None, :, :]
         else:  # vertical
-            for y in range(height):
-                r = int(color1[0] + (color2[0] - color1[0]) * y / height)
-                g = int(color1[1] + (color2[1] - color1[1]) * y / height)
-                b = int(color1[2] + (color2[2] - color1[2]) * y / height)
-                draw.line([(0, y), (width, y)], fill=(r, g, b))
-        
-        return gradient
+            line = gradient_line(height, color1, color2)[:, None, :]
+        return np.broadcast_to(line, (height, width, 3))
     
-    def create_professional_logo(self, size, colors, alpha, text="DD"):
-        """Create a professional DataDash logo with gradient background and prominent DD text"""
-        logo_img = Image.new('RGBA', (size * 2, size), (0, 0, 0, 0))
-        
+    def create_professional_logo(self, size, colors, alpha, text="DD", as_array=False):
+        """
+        Create a professional DataDash logo with gradient background and prominent DD text
+        Returned as an RGBA array instead of an Image when as_array is set
+        """
         # Create gradient background
-        gradient = self.create_gradient(size * 2, size, colors["primary"], colors["secondary"])
-        gradient_alpha = Image.new('L', (size * 2, size), int(220 * alpha))
-        
-        # Convert to RGBA and apply alpha
-        gradient_rgba = gradient.convert('RGBA')
-        gradient_rgba.putalpha(gradient_alpha)
+        gradient = self.gradient_array(size * 2, size, colors["primary"], colors["secondary"])
         
-        # Create rounded rectangle mask
-        mask = Image.new('L', (size * 2, size), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.rounded_rectangle([0, 0, size * 2 - 1, size - 1], radius=15, fill=255)
+        # Create rounded rectangle mask from the cached corner stencil
+        mask = Image.fromarray(rounded_mask(size * 2, size, 15))
         
-        # Apply mask to gradient
-        gradient_rgba.putalpha(ImageEnhance.Brightness(mask).enhance(alpha))
-        logo_img = Image.alpha_composite(logo_img, gradient_rgba)
+        # Apply mask to gradient. Over a transparent logo this is the whole composite:
+        # the gradient under its alpha, with colour cleared where nothing is drawn
+        logo = np.dstack([gradient, np.asarray(ImageEnhance.Brightness(mask).enhance(alpha))])
+        logo[logo[..., 3] == 0] = 0
         
         # Add DataDash DD text with multiple font fallbacks
-        draw = ImageDraw.Draw(logo_img)
+        # The "D" is rasterized once and its mask blitted for every layer below
         font_size = int(size * 0.6)  # Larger font size for visibility
-        font = None
-        
-        # Try multiple font paths for better compatibility
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
-            "/System/Library/Fonts/Helvetica.ttc"
-        ]
-        
-        for font_path in font_paths:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                break
-            except:
-                continue
-        
-        # Fallback to default font if no TrueType fonts found
-        if font is None:
-            try:
-                font = ImageFont.load_default()
-            except:
-                # Ultimate fallback - create text manually
-                return logo_img
+        font = self.get_logo_font(font_size)
         
         # Enhanced text colors for better visibility
         text_color = (*colors["white"], int(255 * alpha))
@@ -140,7 +562,7 @@ class DataDashRenderer:
         # Create modern intersecting DD logo instead of side-by-side text
         # Get single D dimensions for positioning
         try:
-            single_d_bbox = draw.textbbox((0, 0), "D", font=font)
+            single_d_bbox = text_bbox("D", font)
             d_width = single_d_bbox[2] - single_d_bbox[0]
             d_height = single_d_bbox[3] - single_d_bbox[1]
         except:
@@ -167,291 +589,611 @@ class DataDashRenderer:
             shadow_alpha = int(60 * alpha / len(shadow_offsets))
             shadow_col = (*colors["dark"], shadow_alpha)
             # First D shadow
-            draw.text((d1_x + offset[0], d1_y + offset[1]), "D", font=font, fill=shadow_col)
+            self.draw_text(logo, (d1_x + offset[0], d1_y + offset[1]), "D", font, shadow_col)
             # Second D shadow
-            draw.text((d2_x + offset[0], d2_y + offset[1]), "D", font=font, fill=shadow_col)
+            self.draw_text(logo, (d2_x + offset[0], d2_y + offset[1]), "D", font, shadow_col)
         
         # Draw glow effects for both D's
         glow_color = (*colors["primary"], int(80 * alpha))
         for glow_offset in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
             # First D glow
-            draw.text((d1_x + glow_offset[0], d1_y + glow_offset[1]), "D", font=font, fill=glow_color)
+            self.draw_text(logo, (d1_x + glow_offset[0], d1_y + glow_offset[1]), "D", font, glow_color)
             # Second D glow  
-            draw.text((d2_x + glow_offset[0], d2_y + glow_offset[1]), "D", font=font, fill=glow_color)
+            self.draw_text(logo, (d2_x + glow_offset[0], d2_y + glow_offset[1]), "D", font, glow_color)
         
         # Draw the first D with primary color
         first_d_color = (*colors["white"], int(255 * alpha))
-        draw.text((d1_x, d1_y), "D", font=font, fill=first_d_color)
+        self.draw_text(logo, (d1_x, d1_y), "D", font, first_d_color)
         
         # Draw the second D with accent color for contrast
         second_d_color = (*colors["accent"], int(240 * alpha))
-        draw.text((d2_x, d2_y), "D", font=font, fill=second_d_color)
+        self.draw_text(logo, (d2_x, d2_y), "D", font, second_d_color)
         
         # Add subtle outline to make intersection more visible
         outline_color = (*colors["primary"], int(150 * alpha))
         for outline_offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
             # Outline for first D
-            draw.text((d1_x + outline_offset[0], d1_y + outline_offset[1]), "D", font=font, fill=outline_color)
+            self.draw_text(logo, (d1_x + outline_offset[0], d1_y + outline_offset[1]), "D", font, outline_color)
             # Outline for second D
-            draw.text((d2_x + outline_offset[0], d2_y + outline_offset[1]), "D", font=font, fill=outline_color)
+            self.draw_text(logo, (d2_x + outline_offset[0], d2_y + outline_offset[1]), "D", font, outline_color)
         
-        # Redraw main D's on top for crisp appearance
-        draw.text((d1_x, d1_y), "D", font=font, fill=first_d_color)
-        draw.text((d2_x, d2_y), "D", font=font, fill=second_d_color)
+        # Redraw main D's on top for crisp appearance. Not redundant: it puts the
+        # letters back over the outline, and re-blending the anti-aliased edges
+        # is part of the look (each pass is only a cached-mask blit anyway)
+        self.draw_text(logo, (d1_x, d1_y), "D", font, first_d_color)
+        self.draw_text(logo, (d2_x, d2_y), "D", font, second_d_color)
         
-        return logo_img
+        return logo if as_array else Image.fromarray(logo, 'RGBA')
     
-    def create_premium_background(self, width, height, t, colors):
-        """Create animated premium tech background with subtle movement"""
-        bg = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(bg)
+    def _background_state(self, frame_num, total_frames):
+        """Integer drawing parameters of the animated background for a frame"""
+        sched = self.get_schedule(total_frames)
+        lines = None
+        edge_glow = None
         
         # Animated gradient waves - very subtle for Apple cleanliness
-        if t > 0.1:  # Start subtle background animation
-            bg_alpha = min((t - 0.1) / 0.3, 0.05)  # Very subtle, max 5% opacity
-            
-            # Create flowing gradient lines
-            for i in range(3):
-                y_offset = int(100 * math.sin((t * 2 + i) * math.pi)) 
-                y_pos = self.height - 200 + y_offset + (i * 40)
-                
-                if 0 <= y_pos <= self.height:
-                    # Ultra-subtle gradient line
-                    line_color = (*colors["primary"], int(30 * bg_alpha))
-                    draw.ellipse([0, y_pos-20, width, y_pos+20], fill=line_color)
-        
-        # Premium edge glow that builds anticipation
-        if t < 0.8:
-            glow_progress = t / 0.8
-            glow_alpha = int(20 * glow_progress)
+        if sched["lines_active"][frame_num]:
+            line_alpha = sched["line_alpha"][frame_num]
+            y_positions = tuple(int(y_pos) for y_pos in sched["line_y"][frame_num]
+                                if 0 <= y_pos <= self.height)
             
-            # Left edge premium glow
-            for x in range(100):
-                alpha = int(glow_alpha * (100-x) / 100)
-                draw.rectangle([x, 0, x+1, height], fill=(*colors["primary"], alpha))
+            # Fully transparent lines leave no trace on the frame
+            if line_alpha > 0 and y_positions:
+                lines = (int(line_alpha), y_positions)
+        
+        # Premium edge glow that builds anticipation - a zero-alpha strip is a dead frame
+        if sched["edge_glow_active"][frame_num]:
+            edge_glow = int(sched["edge_glow"][frame_num]) or None
+        
+        return lines, edge_glow
+    
+    def get_edge_glow(self, edge_glow, height, color):
+        """
+        Left edge glow strip: a column ramp fading from edge_glow to 0 over 100 px
+        Built with one broadcast instead of a rectangle per column, cached per alpha
+        """
+        key = (edge_glow, height, color)
+        if key not in self._edge_glow_cache:
+            # Column x was last covered by the 2 px rectangle drawn at x (x = 100 by x = 99)
+            x = np.minimum(np.arange(101), 99)
+            row = np.empty((101, 4), np.uint8)
+            row[:, :3] = color
+            row[:, 3] = edge_glow * (100 - x) // 100
+            self._edge_glow_cache[key] = np.broadcast_to(row, (height, 101, 4))
+        return self._edge_glow_cache[key]
+    
+    def background_regions(self, background):
+        """
+        (y0, y1, x0, x1) rectangles of the background layer that can hold ink
+        Everything outside them is transparent and is not composited
+        """
+        lines, edge_glow = background
+        regions = []
+        x0 = 0
+        if edge_glow is not None:
+            regions.append((0, self.height, 0, 101))
+            x0 = 101
+        if lines is not None:
+            # Merge the 41-row bands of lines that overlap each other
+            bands = []
+            for y_pos in sorted(lines[1]):
+                y0, y1 = max(y_pos - 20, 0), min(y_pos + 21, self.height)
+                if bands and y0 <= bands[-1][1]:
+                    bands[-1][1] = max(bands[-1][1], y1)
+                else:
+                    bands.append([y0, y1])
+            regions.extend((y0, y1, x0, self.width) for y0, y1 in bands)
+        return regions
+    
+    def create_premium_background(self, width, height, background, colors, layer=None, dirty=None):
+        """
+        Create animated premium tech background with subtle movement as an RGBA array
+        background is the frame's (lines, edge_glow) state from _background_state
+        Draws into layer (cleared first) when given instead of a new array; dirty lists
+        the (y0, y1, x0, x1) regions that can hold ink, so only those are cleared
+        """
+        if layer is None:
+            bg = np.zeros((height, width, 4), np.uint8)
+        else:
+            bg = layer
+            if dirty is None:
+                bg.fill(0)
+            else:
+                for y0, y1, x0, x1 in dirty:
+                    bg[y0:y1, x0:x1] = 0
+        lines, edge_glow = background
+        
+        # Create flowing gradient lines
+        if lines is not None:
+            line_alpha, y_positions = lines
+            line_color = (*colors["primary"], line_alpha)
+            spans = line_spans(width)
+            for y_pos in y_positions:
+                # Ultra-subtle gradient line: the ellipse [0, y-20, width, y+20], clipped
+                _fill_spans(bg, spans, y_pos - 20, line_color)
+        
+        # Left edge premium glow
+        if edge_glow is not None:
+            bg[:, :101] = self.get_edge_glow(edge_glow, height, colors["primary"])
         
         return bg
     
+    def frame_states(self, total_frames, main_title, subtitle):
+        """Drawing state of every frame of a video, evaluated once per (length, title, subtitle)"""
+        key = (total_frames, main_title, subtitle)
+        states = self._states.pop(key, None)
+        if states is None:
+            states = [self.frame_state(frame_num, total_frames, main_title, subtitle)
+                      for frame_num in range(total_frames)]
+            while len(self._states) >= MAX_FRAME_STATES:
+                del self._states[next(iter(self._states))]
+        self._states[key] = states
+        return states
+    
+    def frame_state(self, frame_num, total_frames, main_title, subtitle):
+        """
+        Quantized drawing state of a frame
+        Frames with equal states are pixel-identical, so renders can be reused
+        """
+        sched = self.get_schedule(total_frames)
+        state = {"background": self._background_state(frame_num, total_frames)}
+        
+        # Premium bar: (width, accent alpha)
+        state["bar"] = None
+        if sched["bar_active"][frame_num]:
+            bar_width = int(sched["bar_width"][frame_num])
+            if bar_width > 0:
+                state["bar"] = (bar_width, int(sched["bar_accent"][frame_num]))
+        
+        # Logo: glow halo alpha, or (size, alpha) of the materializing/settled logo
+        state["logo_glow"] = None
+        state["logo"] = None
+        logo_phase = sched["logo_phase"][frame_num]
+        if logo_phase == 1:
+            state["logo_glow"] = int(sched["logo_glow_alpha"][frame_num]) or None
+        elif logo_phase == 2:
+            # Slight scale animation for premium feel
+            current_size = int(sched["logo_size"][frame_num])
+            state["logo"] = (current_size, int(sched["logo_alpha8"][frame_num]))
+        elif logo_phase == 3:
+            state["logo"] = (75, int(sched["logo_alpha8"][frame_num]))
+        
+        # Title: (characters shown, shadow alphas, title alpha, revealing-glyph glow alpha)
+        state["title"] = None
+        if sched["title_active"][frame_num]:
+            title_length = len(main_title)
+            chars_to_show = int(title_length * sched["title_reveal"][frame_num])
+            if chars_to_show > 0:
+                shadow_alphas = tuple(sched["title_shadow"][frame_num].tolist())
+                char_glow = int(sched["title_glow"][frame_num]) if chars_to_show < title_length else None
+                state["title"] = (chars_to_show, shadow_alphas, int(sched["title_alpha8"][frame_num]), char_glow)
+        
+        # Subtitle: (words shown, shadow alpha, subtitle alpha)
+        state["subtitle"] = None
+        if sched["subtitle_active"][frame_num]:
+            words_to_show = int(len(subtitle.split()) * sched["subtitle_reveal"][frame_num])
+            if words_to_show > 0:
+                state["subtitle"] = (words_to_show, int(sched["subtitle_shadow"][frame_num]),
+                                     int(sched["subtitle_alpha8"][frame_num]))
+        
+        # Ambient glow: alpha of each concentric layer
+        state["glow"] = None
+        if sched["glow_active"][frame_num]:
+            layer_alphas = tuple(sched["glow_layers"][frame_num].tolist())
+            # A glow with fully transparent layers blurs to nothing - skip it
+            if any(layer_alphas):
+                state["glow"] = layer_alphas
+        
+        return state
+    
+    def get_bar(self, bar_width, bar_height):
+        """
+        Shadow and glass layers of the premium bar pasted onto a transparent tile,
+        kept for the last width so the settled bar is composed only once
+        """
+        if self._bar_tile is not None and self._bar_tile[0] == (bar_width, bar_height):
+            return self._bar_tile[1]
+        bar = np.zeros((bar_height + 1, bar_width + 1, 4), np.uint8)
+        
+        # Deep shadow layer for premium depth. Its transparent padding pasted
+        # nothing, so the tile is just the shadow shape placed at the bar origin
+        shadow = self._bar_shadow[:bar_height + 1, :bar_width + 1]
+        shadow_alpha = rounded_mask(bar_width + 1, bar_height + 1, 20, out=shadow[..., 3])
+        shadow_alpha //= 255
+        shadow_alpha *= 40
+        _paste_rgba(bar, shadow, 0, 0)
+        
+        # Medium shadow for layered depth
+        rounded_mask(bar_width + 1, bar_height + 1, 18, out=shadow_alpha)
+        shadow_alpha //= 255
+        shadow_alpha *= 80
+        _paste_rgba(bar, shadow, 0, 0)
+        
+        # Glass overlay layer for premium Apple-like material, masked by the
+        # main bar's rounded corners. The mask is strictly 0/255, so the glass
+        # replaces every pixel the gradient bar would cover - the bar is never
+        # visible and is not composited at all
+        glass_overlay = self._bar_glass[:bar_height, :bar_width]
+        rounded_mask(bar_width, bar_height, 16, out=glass_overlay[..., 3])
+        _paste_rgba(bar, glass_overlay, 0, 0)
+        
+        self._bar_tile = ((bar_width, bar_height), bar)
+        return bar
+    
+    def draw_text(self, layer, xy, text, font, fill):
+        """
+        Draw text onto an RGBA layer array, like ImageDraw.text on an RGBA image
+        Each string is rasterized once; shadows, glows and later frames reuse its mask
+        Returns the (x, y, width, height) the text's mask was placed at
+        """
+        mask, left, top = text_mask(text, font)
+        _fill_mask(layer, mask, fill, xy[0] + left, xy[1] + top)
+        return xy[0] + left, xy[1] + top, mask.shape[1], mask.shape[0]
+    
     def create_frame(self, frame_num, duration, main_title, subtitle):
-        """Create a premium tech reveal lowerthird with Apple-like smoothness"""
+        """
+        Create a premium tech reveal lowerthird with Apple-like smoothness
+        Returns a BGR frame buffer that is overwritten by the next call
+        """
         total_frames = int(duration * self.fps)
+        state = self.frame_states(total_frames, main_title, subtitle)[frame_num]
         
-        # Base frame with premium background
-        base = Image.new('RGB', (self.width, self.height), self.current_colors["background"])
+        # The buffer still holds an identical frame - skip rendering entirely
+        render_key = (total_frames, main_title, subtitle, state)
+        if render_key == self._prev_state:
+            return self._bgr_buf
+        self._prev_state = render_key
         
-        # Animation progress with premium timing
-        t = frame_num / total_frames
+        # The style's palette, bound once - every ink below is one of its colours plus an alpha
+        colors = self.current_colors
+        
+        # Base frame with premium background, composed directly in the BGR output buffer
+        # Only the regions painted over by the previous frame are restored from the template
+        canvas = self._bgr_buf
+        if self._canvas_dirty is None:
+            np.copyto(canvas, self._base_frame)
+        else:
+            for y0, y1, x0, x1 in self._canvas_dirty:
+                canvas[y0:y1, x0:x1] = self._base_frame[y0:y1, x0:x1]
         
         # Add premium animated background
-        premium_bg = self.create_premium_background(self.width, self.height, t, self.current_colors)
-        base_rgba = base.convert('RGBA')
-        base_with_bg = Image.alpha_composite(base_rgba, premium_bg)
+        premium_bg = self.create_premium_background(self.width, self.height, state["background"], colors,
+                                                    layer=self._bg_layer, dirty=self._bg_dirty)
+        regions = self.background_regions(state["background"])
+        for y0, y1, x0, x1 in regions:
+            _composite_over(canvas, premium_bg[y0:y1, x0:x1], x0, y0)
+        self._bg_dirty = regions
+        
+        # Lowerthird elements are drawn into the overlay band at the bottom of the
+        # frame - y coordinates below are relative to OVERLAY_TOP. Only the box the
+        # previous frame inked is cleared, and only this frame's box is composited
+        overlay = self._overlay
+        if self._overlay_box is not None:
+            y0, y1, x0, x1 = self._overlay_box
+            overlay[y0:y1, x0:x1] = 0
+        boxes = []
         
-        overlay = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
+        def paste(tile, x, y):
+            _paste_rgba(overlay, tile, x, y)
+            boxes.append((x, y, tile.shape[1], tile.shape[0]))
+        
+        def text(xy, string, font, fill):
+            boxes.append(self.draw_text(overlay, xy, string, font, fill))
         
         # Premium bar animation with Apple-like smoothness (delayed elegant reveal)
-        bar_start = 0.2  # Delayed start for premium feel
-        bar_duration = 0.5
-        if t > bar_start and t <= (bar_start + bar_duration):
-            bar_t = (t - bar_start) / bar_duration
-            # Custom premium easing - starts slow, elegant acceleration, smooth settle
-            bar_progress = self.ease_out_quart(bar_t)
-            
+        if state["bar"] is not None:
             # Premium bar dimensions - more elegant proportions
-            bar_width = int(650 * bar_progress)
-            bar_x, bar_y, bar_height = 40, 820, 200
+            bar_width, accent_alpha = state["bar"]
+            bar_x, bar_y, bar_height = 40, 820 - OVERLAY_TOP, 200
             
-            if bar_width > 0:
-                # Multi-layered premium bar construction
-                
-                # Deep shadow layer for premium depth
-                deep_shadow = Image.new('RGBA', (bar_width + 16, bar_height + 16), (0, 0, 0, 0))
-                deep_shadow_draw = ImageDraw.Draw(deep_shadow)
-                deep_shadow_draw.rounded_rectangle([8, 8, bar_width + 8, bar_height + 8], 
-                                                 radius=20, fill=(0, 0, 0, 40))
-                
-                # Medium shadow for layered depth
-                med_shadow = Image.new('RGBA', (bar_width + 8, bar_height + 8), (0, 0, 0, 0))
-                med_shadow_draw = ImageDraw.Draw(med_shadow)
-                med_shadow_draw.rounded_rectangle([4, 4, bar_width + 4, bar_height + 4], 
-                                                radius=18, fill=(0, 0, 0, 80))
-                
-                # Premium gradient with more sophistication
-                premium_gradient = self.create_gradient(bar_width, bar_height,
-                                                      self.current_colors["primary"],
-                                                      self.current_colors["secondary"])
-                
-                # Glass overlay layer for premium Apple-like material
-                glass_overlay = Image.new('RGBA', (bar_width, bar_height), (255, 255, 255, 25))
-                
-                # Main bar with perfect rounded corners
-                bar_rgba = premium_gradient.convert('RGBA')
-                mask = Image.new('L', (bar_width, bar_height), 0)
-                mask_draw = ImageDraw.Draw(mask)
-                mask_draw.rounded_rectangle([0, 0, bar_width - 1, bar_height - 1], radius=16, fill=255)
-                bar_rgba.putalpha(mask)
-                glass_overlay.putalpha(mask)
-                
-                # Composite all layers for premium depth
-                overlay.paste(deep_shadow, (bar_x - 8, bar_y - 8), deep_shadow)
-                overlay.paste(med_shadow, (bar_x - 4, bar_y - 4), med_shadow)
-                overlay.paste(bar_rgba, (bar_x, bar_y), bar_rgba)
-                overlay.paste(glass_overlay, (bar_x, bar_y), glass_overlay)
-                
-                # Premium accent highlight - thinner and more sophisticated
-                highlight_height = 3
-                accent_img = Image.new('RGBA', (bar_width, highlight_height), 
-                                     (*self.current_colors["accent"], int(180 * bar_progress)))
-                overlay.paste(accent_img, (bar_x, bar_y), accent_img)
-        
-        # Load fonts with better sizing
-        try:
-            title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 52)
-            subtitle_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 36)
-        except:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
+            # Multi-layered premium bar construction. The bar is the first thing
+            # drawn into the cleared overlay, so its pre-composed layers are copied in
+            bar = self.get_bar(bar_width, bar_height)
+            overlay[bar_y:bar_y + bar.shape[0], bar_x:bar_x + bar.shape[1]] = bar
+            boxes.append((bar_x, bar_y, bar.shape[1], bar.shape[0]))
+            
+            # Premium accent highlight - thinner and more sophisticated
+            highlight_height = 3
+            accent = self._bar_accent[:highlight_height, :bar_width]
+            accent[..., 3] = accent_alpha
+            paste(accent, bar_x, bar_y)
+        
+        title_font = self.title_font
+        subtitle_font = self.subtitle_font
         
         # Premium logo animation with elegant materialization
-        logo_start = 0.4  # Starts after bar is mostly revealed
-        logo_duration = 0.4
-        if t > logo_start:
-            logo_t = min((t - logo_start) / logo_duration, 1.0)
+        if state["logo_glow"] is not None:
+            # Phase 1: Subtle glow appears first
+            logo_glow = scale_alpha(self._logo_glow, state["logo_glow"], out=self._logo_glow_scratch)
+            paste(logo_glow, 50, 835 - OVERLAY_TOP)
+        
+        if state["logo"] is not None:
+            # Phase 2 materializes the logo with scale, phase 3 settles at full size
+            base_size = 75
+            current_size, logo_alpha = state["logo"]
             
-            # Elegant emergence with multiple phases
-            if logo_t < 0.3:
-                # Phase 1: Subtle glow appears first
-                glow_alpha = self.ease_in_out_sine(logo_t / 0.3) * 0.3
-                logo_size = 75
-                glow_size = int(logo_size * 1.2)
-                
-                # Create glow halo
-                glow_img = Image.new('RGBA', (glow_size * 2, glow_size), (0, 0, 0, 0))
-                glow_draw = ImageDraw.Draw(glow_img)
-                glow_draw.ellipse([glow_size//4, glow_size//4, glow_size*1.75, glow_size*0.75], 
-                                fill=(*self.current_colors["primary"], int(60 * glow_alpha)))
-                glow_blurred = glow_img.filter(ImageFilter.GaussianBlur(radius=15))
-                overlay.paste(glow_blurred, (50, 835), glow_blurred)
-                
-            elif logo_t < 0.7:
-                # Phase 2: Logo materializes with scale
-                material_t = (logo_t - 0.3) / 0.4
-                scale_progress = self.ease_out_quart(material_t)
-                logo_alpha = scale_progress
-                
-                # Slight scale animation for premium feel
-                base_size = 75
-                current_size = int(base_size * (0.8 + 0.2 * scale_progress))
-                
-                professional_logo = self.create_professional_logo(current_size, self.current_colors, logo_alpha)
-                logo_x = 60 - int((current_size - base_size) * 0.5)
-                logo_y = 845 - int((current_size - base_size) * 0.3)
-                overlay.paste(professional_logo, (logo_x, logo_y), professional_logo)
-                
-            else:
-                # Phase 3: Final settle with full opacity
-                settle_t = (logo_t - 0.7) / 0.3
-                final_alpha = 0.8 + 0.2 * self.ease_out_quart(settle_t)
-                
-                professional_logo = self.create_professional_logo(75, self.current_colors, final_alpha)
-                overlay.paste(professional_logo, (60, 845), professional_logo)
+            professional_logo = self.get_logo(current_size, logo_alpha)
+            logo_x = 60 - int((current_size - base_size) * 0.5)
+            logo_y = 845 - OVERLAY_TOP - int((current_size - base_size) * 0.3)
+            paste(professional_logo, logo_x, logo_y)
         
         # Premium title animation with elegant character-by-character reveal
-        title_start = 0.6  # Starts after logo materialization
-        title_duration = 0.5
-        if t > title_start:
-            title_t = min((t - title_start) / title_duration, 1.0)
-            
-            # Calculate how many characters to reveal
-            title_length = len(main_title)
-            chars_to_show = int(title_length * self.ease_out_quart(title_t))
+        if state["title"] is not None:
+            chars_to_show, shadow_alphas, title_alpha, char_glow = state["title"]
             visible_title = main_title[:chars_to_show]
             
             # Position with better spacing for premium look
-            title_x, title_y = 230, 835
+            title_x, title_y = 230, 835 - OVERLAY_TOP
+            
+            # Premium shadow with multiple layers for depth
+            for shadow_alpha, offset in zip(shadow_alphas, [(4, 4), (2, 2)]):
+                shadow_color = (*colors["dark"], shadow_alpha)
+                text((title_x + offset[0], title_y + offset[1]), visible_title, 
+                     font=title_font, fill=shadow_color)
             
-            if visible_title:
-                # Premium shadow with multiple layers for depth
-                for i, offset in enumerate([(4, 4), (2, 2)]):
-                    shadow_alpha = int((80 - i*20) * title_t)
-                    shadow_color = (*self.current_colors["dark"], shadow_alpha)
-                    draw.text((title_x + offset[0], title_y + offset[1]), visible_title, 
-                             font=title_font, fill=shadow_color)
-                
-                # Main title with premium white
-                title_alpha = min(title_t * 1.2, 1.0)  # Slightly faster alpha ramp
-                title_color = (*self.current_colors["white"], int(255 * title_alpha))
-                draw.text((title_x, title_y), visible_title, font=title_font, fill=title_color)
-                
-                # Add subtle glow to current character being revealed
-                if chars_to_show < title_length and chars_to_show > 0:
-                    current_char = main_title[chars_to_show-1:chars_to_show]
-                    try:
-                        # Get position of current character
-                        prev_text = main_title[:chars_to_show-1]
-                        prev_bbox = draw.textbbox((0, 0), prev_text, font=title_font)
-                        char_x = title_x + (prev_bbox[2] - prev_bbox[0])
-                        
-                        # Subtle glow on revealing character
-                        glow_color = (*self.current_colors["primary"], int(60 * title_t))
-                        for glow_offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                            draw.text((char_x + glow_offset[0], title_y + glow_offset[1]), 
-                                     current_char, font=title_font, fill=glow_color)
-                    except:
-                        pass
+            # Main title with premium white
+            title_color = (*colors["white"], title_alpha)
+            text((title_x, title_y), visible_title, font=title_font, fill=title_color)
+            
+            # Add subtle glow to current character being revealed
+            if char_glow is not None:
+                current_char = main_title[chars_to_show-1:chars_to_show]
+                try:
+                    # Get position of current character
+                    prev_text = main_title[:chars_to_show-1]
+                    prev_bbox = text_bbox(prev_text, title_font)
+                    char_x = title_x + (prev_bbox[2] - prev_bbox[0])
+                    
+                    # Subtle glow on revealing character - four blits of one cached mask;
+                    # stacked blends are not a blur, so they are not fused into one
+                    glow_color = (*colors["primary"], char_glow)
+                    for glow_offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                        text((char_x + glow_offset[0], title_y + glow_offset[1]), 
+                             current_char, font=title_font, fill=glow_color)
+                except:
+                    pass
         
         # Premium subtitle with word-by-word reveal
-        subtitle_start = 0.8  # Starts near end of title reveal
-        subtitle_duration = 0.4
-        if t > subtitle_start:
-            subtitle_t = min((t - subtitle_start) / subtitle_duration, 1.0)
-            
-            # Word-by-word reveal for sophistication
-            words = subtitle.split()
-            words_to_show = int(len(words) * self.ease_out_quart(subtitle_t))
-            visible_subtitle = " ".join(words[:words_to_show])
+        if state["subtitle"] is not None:
+            words_to_show, shadow_alpha, subtitle_alpha = state["subtitle"]
+            visible_subtitle = " ".join(subtitle.split()[:words_to_show])
             
             # Position with elegant spacing
-            subtitle_x, subtitle_y = 230, 890
+            subtitle_x, subtitle_y = 230, 890 - OVERLAY_TOP
+            
+            # Elegant shadow
+            shadow_color = (*colors["dark"], shadow_alpha)
+            text((subtitle_x + 2, subtitle_y + 2), visible_subtitle, 
+                 font=subtitle_font, fill=shadow_color)
             
-            if visible_subtitle:
-                # Elegant shadow
-                shadow_alpha = int(100 * subtitle_t)
-                shadow_color = (*self.current_colors["dark"], shadow_alpha)
-                draw.text((subtitle_x + 2, subtitle_y + 2), visible_subtitle, 
-                         font=subtitle_font, fill=shadow_color)
-                
-                # Main subtitle with accent color
-                subtitle_alpha = min(subtitle_t * 1.3, 1.0)
-                subtitle_color = (*self.current_colors["accent"], int(240 * subtitle_alpha))
-                draw.text((subtitle_x, subtitle_y), visible_subtitle, 
-                         font=subtitle_font, fill=subtitle_color)
+            # Main subtitle with accent color
+            subtitle_color = (*colors["accent"], subtitle_alpha)
+            text((subtitle_x, subtitle_y), visible_subtitle, 
+                 font=subtitle_font, fill=subtitle_color)
         
         # Premium ambient glow that builds throughout animation
-        if t > 0.5:
-            glow_alpha = min((t - 0.5) / 0.4, 0.2)  # More subtle for Apple cleanliness
-            
-            # Create sophisticated glow area
-            glow_width, glow_height = 700, 140
-            glow_img = Image.new('RGBA', (glow_width, glow_height), (0, 0, 0, 0))
-            glow_draw = ImageDraw.Draw(glow_img)
-            
-            # Multi-layer glow for premium depth
-            center_x, center_y = glow_width // 2, glow_height // 2
-            for radius in [60, 40, 20]:
-                alpha = int(20 * glow_alpha * (60 - radius) / 40)
-                glow_draw.ellipse([center_x - radius, center_y - radius, 
-                                 center_x + radius, center_y + radius],
-                                fill=(*self.current_colors["primary"], alpha))
-            
-            # Apply sophisticated blur
-            premium_glow = glow_img.filter(ImageFilter.GaussianBlur(radius=25))
-            overlay.paste(premium_glow, (190, 815), premium_glow)
+        if state["glow"] is not None:
+            paste(self.get_ambient_glow(state["glow"]), 190, 815 - OVERLAY_TOP)
         
-        # Final composition with premium background
-        final_img = Image.alpha_composite(base_with_bg, overlay).convert('RGB')
-        return cv2.cvtColor(np.array(final_img), cv2.COLOR_RGB2BGR)
+        # Final composition with premium background, limited to the inked box
+        self._overlay_box = ink_box(boxes, overlay.shape)
+        if self._overlay_box is not None:
+            y0, y1, x0, x1 = self._overlay_box
+            _composite_over(canvas, overlay[y0:y1, x0:x1], x0, OVERLAY_TOP + y0)
+            regions = regions + [(OVERLAY_TOP + y0, OVERLAY_TOP + y1, x0, x1)]
+        self._canvas_dirty = regions
+        return canvas
+
+# ffmpeg encoder settings: NVIDIA or VA-API (Intel/AMD) hardware encoders on GPU hosts,
+# threaded x264 otherwise. VA-API encodes from GPU surfaces, so frames are uploaded as NV12
+X264_ARGS = ("-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p")
+NVENC_ARGS = ("-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-pix_fmt", "yuv420p")
+VAAPI_ARGS = ("-vf", "format=nv12,hwupload", "-c:v", "h264_vaapi")
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+class FFmpegWriter:
+    """
+    Video writer piping raw frames into an ffmpeg H.264 encoder
+    Mirrors the cv2.VideoWriter methods used by generate_lowerthird
+    BGR frames are converted to the encoder's yuv420p with OpenCV before piping,
+    which halves the bytes sent and replaces ffmpeg's slower swscale conversion
+    Frames arrive fully composited: the background lines and edge glow animate
+    across the whole frame, so an ffmpeg overlay of the lowerthird onto a colour
+    source would not reproduce them (nor Pillow's blend rounding)
+    """
+    
+    def __init__(self, output_path, fps, frame_size, codec_args=X264_ARGS, device_args=()):
+        width, height = frame_size
+        command = [
+            shutil.which("ffmpeg"), "-y", "-loglevel", "error", *device_args,
+            "-f", "rawvideo", "-pix_fmt", "yuv420p", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+            *codec_args, "-threads", "0", output_path
+        ]
+        self.output_path = output_path
+        self._yuv = np.empty((height * 3 // 2, width), np.uint8)
+        self._last_frame = None
+        self._proc = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=10**8)
+    
+    def isOpened(self):
+        return self._proc.poll() is None
+    
+    def write(self, frame):
+        # Runs of repeated frames are written as the same (unmodified) array - convert it once
+        if frame is not self._last_frame:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420, dst=self._yuv)
+            self._last_frame = frame
+        self._proc.stdin.write(self._yuv.data)
+    
+    def release(self):
+        """Flush and close the encoder, raising if ffmpeg failed"""
+        if self._proc.stdin.closed:
+            return
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self._proc.wait()
+        if returncode != 0:
+            error = self._proc.stderr.read().decode(errors="replace").strip()
+            raise Exception(f"ffmpeg failed to encode {self.output_path}: {error}")
+
+@lru_cache(maxsize=None)
+def ffmpeg_encoders():
+    """Encoder listing of the installed ffmpeg build (empty when it cannot be queried)"""
+    try:
+        return subprocess.run([shutil.which("ffmpeg"), "-hide_banner", "-encoders"],
+                              capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+@lru_cache(maxsize=None)
+def encoder_works(codec_args, device_args=()):
+    """
+    Whether ffmpeg can actually encode with the given arguments, probed once with a
+    short trial encode - an encoder can be listed yet unusable (no device in the
+    container, no VA driver, NVENC session limit), which would fail every render
+    """
+    command = [shutil.which("ffmpeg"), "-hide_banner", "-loglevel", "error", *device_args,
+               "-f", "lavfi", "-i", "color=s=256x256:d=0.1", *codec_args, "-f", "null", "-"]
+    try:
+        return subprocess.run(command, capture_output=True, timeout=30).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+def nvenc_available():
+    """Whether an NVIDIA GPU and an ffmpeg build with a working h264_nvenc are both present"""
+    return (bool(shutil.which("nvidia-smi")) and "h264_nvenc" in ffmpeg_encoders()
+            and encoder_works(NVENC_ARGS))
+
+def vaapi_available():
+    """Whether a VA-API render node and an ffmpeg build with a working h264_vaapi are both present"""
+    return (os.path.exists(VAAPI_DEVICE) and "h264_vaapi" in ffmpeg_encoders()
+            and encoder_works(VAAPI_ARGS, ("-vaapi_device", VAAPI_DEVICE)))
+
+def open_video_writer(output_path, fps, frame_size):
+    """
+    Open an ffmpeg H.264 writer - NVENC or VA-API on GPU hosts, libx264 otherwise -
+    falling back to OpenCV's mp4v encoder when ffmpeg is not installed
+    """
+    if shutil.which("ffmpeg"):
+        if nvenc_available():
+            return FFmpegWriter(output_path, fps, frame_size, NVENC_ARGS)
+        if vaapi_available():
+            return FFmpegWriter(output_path, fps, frame_size, VAAPI_ARGS,
+                                device_args=("-vaapi_device", VAAPI_DEVICE))
+        return FFmpegWriter(output_path, fps, frame_size, X264_ARGS)
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    return cv2.VideoWriter(output_path, fourcc, fps, frame_size)
+
+# Renderers owned by each frame-rendering worker process, keyed by palette name
+_worker_renderers = {}
+
+def _init_render_worker():
+    """Pool initializer: renderers are built lazily per style and kept for later requests"""
+    global _worker_renderers
+    _worker_renderers = {}
+    # The pool already renders one frame per CPU - a Numba thread pool per worker would oversubscribe
+    numba.set_num_threads(1)
+
+def _render_worker_frame(style, frame_num, duration, main_title, subtitle):
+    """Render a single frame in a worker process"""
+    # Unknown styles render with cloud_blue - share its renderer rather than keeping one per name
+    palette = style if style in DataDashRenderer.colors else "cloud_blue"
+    renderer = _worker_renderers.get(palette)
+    if renderer is None:
+        renderer = _worker_renderers[palette] = DataDashRenderer(style=palette)
+    # The BGR buffer is returned as-is: apply_async pickles each result before
+    # the worker picks up its next frame, so the buffer is never overwritten early
+    return renderer.create_frame(frame_num, duration, main_title, subtitle)
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+def get_render_pool(workers):
+    """
+    Return the process-wide frame-rendering pool, starting it on first use
+    Workers outlive a request so later renders skip process start-up and reuse
+    the renderers (and their font, glyph and glow caches) built by earlier ones
+    Workers are spawned, not forked: this process already runs Numba's
+    thread pool and the encoder thread, neither of which survives a fork
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            context = multiprocessing.get_context("spawn")
+            _render_pool = context.Pool(workers, initializer=_init_render_worker)
+            # Stop the idle workers before interpreter shutdown tears down the pool's modules
+            atexit.register(_render_pool.terminate)
+        return _render_pool
+
+class ThreadedWriter:
+    """
+    Feeds a video writer from a background thread so encoding overlaps rendering
+    Frames are queued by reference - callers must not modify them after write()
+    """
+    
+    def __init__(self, writer, maxsize=8):
+        self.writer = writer
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._error = None
+        self._thread = threading.Thread(target=self._encode, daemon=True)
+        self._thread.start()
+    
+    def _encode(self):
+        while (frame := self._queue.get()) is not None:
+            if self._error is not None:
+                continue  # Keep draining so write() never blocks on a dead encoder
+            try:
+                self.writer.write(frame)
+            except Exception as e:
+                self._error = e
+    
+    def isOpened(self):
+        return self.writer.isOpened()
+    
+    def write(self, frame):
+        if self._error is not None:
+            raise self._error
+        self._queue.put(frame)
+    
+    def release(self):
+        """Wait for queued frames to be encoded, then release the wrapped writer"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.writer.release()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+def warm_up():
+    """
+    Compile the pixel kernels (or load them from Numba's cache) ahead of the first request
+    Renders every distinct frame of a short clip: kernels are compiled per array layout,
+    and the later phases (settled bar and logo, lines without the edge glow) pass
+    full-width and full-size buffers that mid-animation frames never do
+    """
+    renderer = DataDashRenderer()
+    duration = 1.0
+    total_frames = int(duration * renderer.fps)
+    renderer.build_schedule(total_frames)
+    prev_state = None
+    for frame_num, state in enumerate(renderer.frame_states(total_frames, "DataDash", "Fortinet Community Insights")):
+        if state != prev_state:
+            renderer.create_frame(frame_num, duration, "DataDash", "Fortinet Community Insights")
+            prev_state = state
+
+# Default cap on frame-rendering processes - each spawned worker holds its own
+# interpreter, kernels and frame buffers (~200 MB)
+MAX_RENDER_WORKERS = 8
+
+def render_workers():
+    """Number of frame-rendering processes, from RENDER_WORKERS or the CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, int(os.getenv("RENDER_WORKERS", min(cpus, MAX_RENDER_WORKERS))))
 
 def generate_lowerthird(main_title, subtitle, output_name, duration=4.0, style="default"):
     """
@@ -466,21 +1208,56 @@ def generate_lowerthird(main_title, subtitle, output_name, duration=4.0, style="
     # Initialize renderer
     renderer = DataDashRenderer(style=style)
     total_frames = int(duration * renderer.fps)
+    renderer.build_schedule(total_frames)
     
     # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    writer = cv2.VideoWriter(output_path, fourcc, renderer.fps, 
-                           (renderer.width, renderer.height))
+    writer = open_video_writer(output_path, renderer.fps, (renderer.width, renderer.height))
     
     if not writer.isOpened():
         raise Exception(f"Failed to create video writer for {output_path}")
+    writer = ThreadedWriter(writer)
     
     try:
-        # Render all frames
-        for frame_num in range(total_frames):
-            frame = renderer.create_frame(frame_num, duration, main_title, subtitle)
-            writer.write(frame)
+        # Group consecutive frames with the same drawing state - each run is rendered once
+        runs = []
+        prev_state = None
+        for frame_num, state in enumerate(renderer.frame_states(total_frames, main_title, subtitle)):
+            if state != prev_state:
+                runs.append([frame_num, 1])
+                prev_state = state
+            else:
+                runs[-1][1] += 1
         
+        workers = min(render_workers(), len(runs))
+        if workers > 1:
+            # Frames are independent - render them in parallel, draining results in order.
+            # At most two frames per worker are in flight so a slow encoder cannot let
+            # finished 6 MB frames pile up in memory
+            pool = get_render_pool(render_workers())
+            pending = deque()
+            
+            def write_oldest():
+                result, repeat = pending.popleft()
+                frame = result.get()
+                for _ in range(repeat):
+                    writer.write(frame)
+            
+            for frame_num, repeat in runs:
+                args = (style, frame_num, duration, main_title, subtitle)
+                pending.append((pool.apply_async(_render_worker_frame, args), repeat))
+                if len(pending) >= 2 * workers:
+                    write_oldest()
+            while pending:
+                write_oldest()
+        else:
+            for frame_num, repeat in runs:
+                # The renderer reuses its output buffer - queue a copy for the encoder thread
+                frame = renderer.create_frame(frame_num, duration, main_title, subtitle).copy()
+                for _ in range(repeat):
+                    writer.write(frame)
+        
+        # Finish encoding inside the try so encoder errors are reported as failures
+        writer.release()
         return output_path
         
     except Exception as e:
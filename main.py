@@ -6,11 +6,45 @@ Follows the 40docs microservice architecture pattern
 """
 
 from flask import Flask, request, jsonify
+from concurrent.futures import ThreadPoolExecutor
 import os
-from lowerthird_service import generate_lowerthird
+import threading
+import time
+import uuid
+from lowerthird_service import generate_lowerthird, warm_up
 
 app = Flask(__name__)
 
+# Background renders for asynchronous requests, tracked by job id.
+# Finished jobs are forgotten JOB_TTL seconds after they complete
+executor = ThreadPoolExecutor(max_workers=int(os.getenv("JOB_WORKERS", 2)))
+JOB_TTL = float(os.getenv("JOB_TTL", 3600))
+jobs = {}
+jobs_lock = threading.Lock()
+
+# Output names being written by a sync or async render (guarded by jobs_lock)
+active_outputs = set()
+
+def claim_output(output_name):
+    """Reserve an output name for a render, returning False if another render is writing it"""
+    with jobs_lock:
+        if output_name in active_outputs:
+            return False
+        active_outputs.add(output_name)
+        return True
+
+def release_output(output_name):
+    """Free an output name once its render has finished"""
+    with jobs_lock:
+        active_outputs.discard(output_name)
+
+def prune_jobs():
+    """Drop finished jobs older than JOB_TTL (call with jobs_lock held)"""
+    cutoff = time.time() - JOB_TTL
+    for job_id in [job_id for job_id, job in jobs.items()
+                   if job["finished"] is not None and job["finished"] < cutoff]:
+        del jobs[job_id]
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint for container orchestration"""
@@ -27,8 +61,12 @@ def create_lowerthird():
         "subtitle": "Fortinet Security Insights", 
         "output_name": "my_lowerthird",
         "duration": 4.0,
-        "style": "cloud_blue"
+        "style": "cloud_blue",
+        "async": false
     }
+    
+    With "async": true the render is queued and 202 is returned with a job id
+    to poll at /status/<job_id>
     """
     try:
         # Parse request data
@@ -51,29 +89,87 @@ def create_lowerthird():
         if len(main_title) > 100 or len(subtitle) > 100:
             return jsonify({"error": "Title or subtitle too long (max 100 chars)"}), 400
         
+        parameters = {
+            "main_title": main_title,
+            "subtitle": subtitle,
+            "duration": duration,
+            "style": style
+        }
+        
+        # Queue the render and answer immediately
+        if data.get('async') is True:
+            job_id = uuid.uuid4().hex
+            # Concurrent jobs must not share an output file - unnamed jobs are named after their id
+            output_name = data.get('output_name', job_id)
+            if not claim_output(output_name):
+                return jsonify({"error": f"A render writing '{output_name}' is already in progress"}), 409
+            
+            def finish(future):
+                job["finished"] = time.time()
+                release_output(output_name)
+            
+            with jobs_lock:
+                prune_jobs()
+                job = {"output_name": output_name, "parameters": parameters, "finished": None}
+                job["future"] = executor.submit(generate_lowerthird, main_title=main_title, subtitle=subtitle,
+                                                output_name=output_name, duration=duration, style=style)
+                jobs[job_id] = job
+            job["future"].add_done_callback(finish)
+            return jsonify({
+                "status": "queued",
+                "job_id": job_id,
+                "status_url": f"/status/{job_id}",
+                "parameters": parameters
+            }), 202
+        
         # Generate lowerthird video
-        video_path = generate_lowerthird(
-            main_title=main_title,
-            subtitle=subtitle,
-            output_name=output_name,
-            duration=duration,
-            style=style
-        )
+        if not claim_output(output_name):
+            return jsonify({"error": f"A render writing '{output_name}' is already in progress"}), 409
+        try:
+            video_path = generate_lowerthird(
+                main_title=main_title,
+                subtitle=subtitle,
+                output_name=output_name,
+                duration=duration,
+                style=style
+            )
+        finally:
+            release_output(output_name)
         
         return jsonify({
             "status": "ok",
             "video": video_path,
-            "parameters": {
-                "main_title": main_title,
-                "subtitle": subtitle,
-                "duration": duration,
-                "style": style
-            }
+            "parameters": parameters
         })
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/status/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Status of an asynchronous lowerthird render"""
+    with jobs_lock:
+        prune_jobs()
+        job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    
+    future = job["future"]
+    if not future.done():
+        status = "running" if future.running() else "queued"
+        return jsonify({"status": status, "job_id": job_id, "parameters": job["parameters"]})
+    
+    error = future.exception()
+    if error is not None:
+        return jsonify({"status": "error", "job_id": job_id, "error": str(error)}), 500
+    
+    return jsonify({
+        "status": "ok",
+        "job_id": job_id,
+        "video": future.result(),
+        "parameters": job["parameters"]
+    })
+
 @app.route('/styles', methods=['GET'])
 def list_styles():
     """List available DataDash lowerthird styles"""
@@ -91,5 +187,8 @@ if __name__ == '__main__':
     output_dir = os.getenv("OUTPUT_DIR", "/app/outputs")
     os.makedirs(output_dir, exist_ok=True)
     
+    # JIT-compile the rendering kernels so the first request doesn't pay for it
+    warm_up()
+    
     # Run Flask app
     app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file